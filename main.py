@@ -13,11 +13,13 @@ class Accessory(BaseModel):
 	color: str
 	in_stock: bool | None = None
 
-accessories_example_db = [
-    {"id":1, "name":"Coque iPhone 14", "color":"Noir", "in_stock":True},
-    {"id":2, "name":"Chargeur Samsung", "color":"Blanc", "in_stock":False},
-    {"id":3, "name":"Écouteurs Bluetooth", "color":"Bleu", "in_stock":True},
-]
+accessories_example_db = {
+    1: {"id":1, "name":"Coque iPhone 14", "color":"Noir", "in_stock":True},
+    2: {"id":2, "name":"Chargeur Samsung", "color":"Blanc", "in_stock":False},
+    3: {"id":3, "name":"Écouteurs Bluetooth", "color":"Bleu", "in_stock":True},
+}
+
+_next_id = max(accessories_example_db) + 1
 
 @app.get("/")
 def read_root():
@@ -34,34 +36,30 @@ def update_item(item_id: int, item: Item):
 
 @app.get("/accessories")
 def read_all_accessories():
-	return {"accessories": accessories_example_db}
+	return {"accessories": list(accessories_example_db.values())}
 
 @app.get("/accessories/{accessory_id}")
 def read_accessory(accessory_id: int):
-	for acc in accessories_example_db:
-		if acc["id"] == accessory_id:
-			return acc
-	return {"Error": "Not Found!"}
+	return accessories_example_db.get(accessory_id, {"Error": "Not Found!"})
 
 @app.post("/accessories")
 def add_accessory(accessory: Accessory):
-	new_id = len(accessories_example_db) + 1
-	new_acc = {"id": new_id, **accessory.dict()}
-	accessories_example_db.append(new_acc)
+	global _next_id
+	new_id = _next_id
+	_next_id += 1
+	new_acc = {"id": new_id, **accessory.model_dump()}
+	accessories_example_db[new_id] = new_acc
 	return new_acc
 
 @app.put("/accessories/{accessory_id}")
 def update_accessory(accessory_id: int, accessory: Accessory):
-	for i, acc in enumerate(accessories_example_db):
-		if acc["id"]==accessory_id:
-			accessories_example_db[i]={"id": accessory_id, **accessory.dict()}
-			return {"accessory_name": accessory.name, "accessory_id":accessory_id}
+	if accessory_id in accessories_example_db:
+		accessories_example_db[accessory_id] = {"id": accessory_id, **accessory.model_dump()}
+		return {"accessory_name": accessory.name, "accessory_id":accessory_id}
 	return {"error": "not found!"}
 
 @app.delete("/accessories/{accessory_id}")
 def delete_accessory(accessory_id: int):
-	for i, acc in enumerate(accessories_example_db):
-		if acc["id"]==accessory_id :
-			accessories_example_db.pop(i)
-			return {"result": "deleted"}
+	if accessories_example_db.pop(accessory_id, None) is not None:
+		return {"result": "deleted"}
 	return {"result": "not found!"}